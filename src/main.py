@@ -1,12 +1,16 @@
 """Barcode Printer GUI using Flet framework."""
 
-import base64
+import asyncio
+import atexit
 import ctypes
 import ctypes.wintypes
 import json
 import os
 import tempfile
 import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
@@ -18,8 +22,12 @@ import barcode as python_barcode
 import flet as ft
 import flet_datatable2 as ftd
 import qrcode
-from barcode.writer import ImageWriter
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib json module
+    orjson = None
 
 ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
 
@@ -27,16 +35,85 @@ ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
 HORZRES = 8
 VERTRES = 10
 LOGPIXELSX = 88
+COLORONCOLOR = 3
 CF_UNICODETEXT = 13
 
 # ── Windows API via ctypes (replaces win32print / win32ui / win32clipboard) ───
-winspool = ctypes.WinDLL("winspool.drv")
+winspool = ctypes.WinDLL("winspool.drv", use_last_error=True)
 gdi32 = ctypes.WinDLL("gdi32")
 user32 = ctypes.WinDLL("user32")
 kernel32 = ctypes.WinDLL("kernel32")
 
+# Declared signatures let ctypes use fixed converters instead of guessing per
+# call; handles are pointer-sized, and without restype would be cut to 32 bits
+_HANDLE = ctypes.c_void_p
+_BOOL = ctypes.wintypes.BOOL
+_DWORD = ctypes.wintypes.DWORD
+_LPCWSTR = ctypes.wintypes.LPCWSTR
+_INT = ctypes.c_int
+
+winspool.EnumPrintersW.argtypes = [
+    _DWORD,
+    _LPCWSTR,
+    _DWORD,
+    ctypes.c_void_p,
+    _DWORD,
+    ctypes.POINTER(_DWORD),
+    ctypes.POINTER(_DWORD),
+]
+winspool.EnumPrintersW.restype = _BOOL
+winspool.GetDefaultPrinterW.argtypes = [ctypes.c_wchar_p, ctypes.POINTER(_DWORD)]
+winspool.GetDefaultPrinterW.restype = _BOOL
+winspool.OpenPrinterW.argtypes = [_LPCWSTR, ctypes.POINTER(_HANDLE), ctypes.c_void_p]
+winspool.OpenPrinterW.restype = _BOOL
+winspool.ClosePrinter.argtypes = [_HANDLE]
+winspool.ClosePrinter.restype = _BOOL
+
+gdi32.CreateDCW.argtypes = [_LPCWSTR, _LPCWSTR, _LPCWSTR, ctypes.c_void_p]
+gdi32.CreateDCW.restype = _HANDLE
+gdi32.DeleteDC.argtypes = [_HANDLE]
+gdi32.DeleteDC.restype = _BOOL
+gdi32.GetDeviceCaps.argtypes = [_HANDLE, _INT]
+gdi32.GetDeviceCaps.restype = _INT
+gdi32.SetStretchBltMode.argtypes = [_HANDLE, _INT]
+gdi32.SetStretchBltMode.restype = _INT
+gdi32.StartDocW.argtypes = [_HANDLE, ctypes.c_void_p]
+gdi32.StartDocW.restype = _INT
+for _fn in (gdi32.StartPage, gdi32.EndPage, gdi32.EndDoc):
+    _fn.argtypes = [_HANDLE]
+    _fn.restype = _INT
+gdi32.StretchDIBits.argtypes = [
+    _HANDLE,
+    *[_INT] * 8,  # destination and source rectangles
+    ctypes.c_void_p,
+    ctypes.c_void_p,
+    ctypes.c_uint,
+    _DWORD,
+]
+gdi32.StretchDIBits.restype = _INT
+
+kernel32.GlobalAlloc.argtypes = [ctypes.c_uint, ctypes.c_size_t]
+kernel32.GlobalAlloc.restype = _HANDLE
+kernel32.GlobalLock.argtypes = [_HANDLE]
+kernel32.GlobalLock.restype = ctypes.c_void_p
+kernel32.GlobalUnlock.argtypes = [_HANDLE]
+kernel32.GlobalUnlock.restype = ctypes.c_int
+kernel32.GlobalFree.argtypes = [_HANDLE]
+kernel32.GlobalFree.restype = _HANDLE
+user32.OpenClipboard.argtypes = [_HANDLE]
+user32.OpenClipboard.restype = ctypes.c_int
+user32.EmptyClipboard.argtypes = []
+user32.EmptyClipboard.restype = ctypes.c_int
+user32.SetClipboardData.argtypes = [ctypes.c_uint, _HANDLE]
+user32.SetClipboardData.restype = _HANDLE
+user32.CloseClipboard.argtypes = []
+user32.CloseClipboard.restype = ctypes.c_int
+
 PRINTER_ENUM_LOCAL = 0x00000002
 PRINTER_ENUM_CONNECTIONS = 0x00000004
+ERROR_INSUFFICIENT_BUFFER = 122
+# Fits a few dozen PRINTER_INFO_4 entries, so one EnumPrintersW call usually does
+ENUM_PRINTERS_BUFFER_SIZE = 16 * 1024
 
 
 class PRINTER_INFO_4(ctypes.Structure):
@@ -49,26 +126,37 @@ class PRINTER_INFO_4(ctypes.Structure):
     ]
 
 
-def _enum_printers_simple() -> list[str]:
+def _enum_printers_simple(
+    flags: int = PRINTER_ENUM_LOCAL | PRINTER_ENUM_CONNECTIONS,
+) -> list[str]:
     """Enumerate printers using PRINTER_INFO_4 (level 4) via winspool.drv."""
-    flags = PRINTER_ENUM_LOCAL | PRINTER_ENUM_CONNECTIONS
     level = 4
-
-    needed = ctypes.c_ulong(0)
-    returned = ctypes.c_ulong(0)
-
-    # First call: get required buffer size (will fail with ERROR_INSUFFICIENT_BUFFER)
-    winspool.EnumPrintersW(
-        flags, None, level, None, 0, ctypes.byref(needed), ctypes.byref(returned)
-    )
-    if needed.value == 0:
-        return []
-
-    buf = (ctypes.c_byte * needed.value)()
-    ok = winspool.EnumPrintersW(
-        flags, None, level, buf, needed, ctypes.byref(needed), ctypes.byref(returned)
-    )
-    if not ok or returned.value == 0:
+    size = ENUM_PRINTERS_BUFFER_SIZE
+
+    while True:
+        buf = (ctypes.c_byte * size)()
+        needed = ctypes.c_ulong(0)
+        returned = ctypes.c_ulong(0)
+        ok = winspool.EnumPrintersW(
+            flags,
+            None,
+            level,
+            buf,
+            size,
+            ctypes.byref(needed),
+            ctypes.byref(returned),
+        )
+        if ok:
+            break
+        # Only grow and retry when the buffer was too small; printers can be
+        # added between calls, so the required size may change again
+        if ctypes.get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+            return []
+        if needed.value <= size:
+            return []
+        size = needed.value
+
+    if returned.value == 0:
         return []
 
     # Cast buffer to an array of PRINTER_INFO_4 structs
@@ -83,21 +171,50 @@ def _get_default_printer() -> str:
     return buf.value
 
 
+def _printer_exists(printer_name: str) -> bool:
+    """Check one printer by opening it, without enumerating all of them."""
+    handle = ctypes.c_void_p()
+    if not winspool.OpenPrinterW(printer_name, ctypes.byref(handle), None):
+        return False
+    winspool.ClosePrinter(handle)
+    return True
+
+
 # ── Clipboard via ctypes (replaces win32clipboard) ────────────────────────────
 
 
+CLIPBOARD_OPEN_ATTEMPTS = 5
+CLIPBOARD_RETRY_SECONDS = 0.01
+
+
 def set_clipboard_text(text: str) -> None:
-    """Copy unicode text to clipboard."""
+    """Copy unicode text to clipboard; raises OSError if it cannot be set."""
     GMEM_MOVEABLE = 0x0002
-    data = (text + "\0").encode("utf-16-le")
-    h = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
-    ptr = kernel32.GlobalLock(h)
-    ctypes.memmove(ptr, data, len(data))
-    kernel32.GlobalUnlock(h)
-    user32.OpenClipboard(None)
-    user32.EmptyClipboard()
-    user32.SetClipboardData(CF_UNICODETEXT, h)
-    user32.CloseClipboard()
+    # Another application may hold the clipboard briefly; retry before failing
+    for _ in range(CLIPBOARD_OPEN_ATTEMPTS):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(CLIPBOARD_RETRY_SECONDS)
+    else:
+        raise OSError("Clipboard is in use by another application")
+    try:
+        data = (text + "\0").encode("utf-16-le")
+        h = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not h:
+            raise OSError("GlobalAlloc failed")
+        ptr = kernel32.GlobalLock(h)
+        if not ptr:
+            kernel32.GlobalFree(h)
+            raise OSError("GlobalLock failed")
+        ctypes.memmove(ptr, data, len(data))
+        kernel32.GlobalUnlock(h)
+        user32.EmptyClipboard()
+        # On success the clipboard owns the memory; otherwise it is still ours
+        if not user32.SetClipboardData(CF_UNICODETEXT, h):
+            kernel32.GlobalFree(h)
+            raise OSError("SetClipboardData failed")
+    finally:
+        user32.CloseClipboard()
 
 
 # ── Printing via GDI (replaces win32ui / win32print / PIL.ImageWin) ───────────
@@ -113,92 +230,164 @@ class _DOCINFOW(ctypes.Structure):
     ]
 
 
-def _print_image_gdi(img: Image.Image, printer_name: str) -> None:
-    """Send PIL image to a Windows printer using raw GDI / ctypes."""
-    # Create printer DC
-    hdc = gdi32.CreateDCW("WINSPOOL", printer_name, None, None)
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+class _BITMAPINFO(ctypes.Structure):
+    _fields_ = [
+        ("bmiHeader", _BITMAPINFOHEADER),
+        ("bmiColors", ctypes.c_uint32 * 256),  # RGBQUAD palette
+    ]
+
+
+# Identity grayscale RGBQUAD table for 8-bit DIBs (0x00RRGGBB, R = G = B = i)
+_GRAY_PALETTE = [i * 0x010101 for i in range(256)]
+
+
+_DC_CACHE: dict[str, int] = {}
+_DC_LOCK = threading.Lock()
+
+
+def _get_printer_dc(printer_name: str) -> int:
+    """Return the cached printer DC, creating it on first use."""
+    hdc = _DC_CACHE.get(printer_name)
     if not hdc:
-        raise RuntimeError(f"CreateDC failed for '{printer_name}'")
+        # CreateDC is a spooler round-trip plus driver setup; do it once
+        hdc = gdi32.CreateDCW("WINSPOOL", printer_name, None, None)
+        if not hdc:
+            raise RuntimeError(f"CreateDC failed for '{printer_name}'")
+        _DC_CACHE[printer_name] = hdc
+    return hdc
 
-    try:
-        # Start document
-        di = _DOCINFOW()
-        di.cbSize = ctypes.sizeof(_DOCINFOW)
-        di.lpszDocName = "Barcode Print"
-        if gdi32.StartDocW(hdc, ctypes.byref(di)) <= 0:
-            raise RuntimeError("StartDoc failed")
-        gdi32.StartPage(hdc)
-
-        # Query printable area & DPI
-        pw = gdi32.GetDeviceCaps(hdc, HORZRES)
-        ph = gdi32.GetDeviceCaps(hdc, VERTRES)
-        dpi = gdi32.GetDeviceCaps(hdc, LOGPIXELSX)
-
-        max_w = int(CONFIG.width_inches * dpi)
-        ratio = img.height / img.width
-        target_w = min(max_w, pw)
-        target_h = int(target_w * ratio)
-        if target_h > ph:
-            target_h = ph
-            target_w = int(target_h / ratio)
-
-        img = img.resize((target_w, target_h), Image.Resampling.LANCZOS)
-        img = img.convert("RGB")
 
-        x1 = (pw - target_w) // 2
-        y1 = (ph - target_h) // 2
-
-        # Build a DIB section and StretchDIBits to the printer DC
-        w, h = img.size
-        pixels = img.tobytes("raw", "BGR")  # GDI expects BGR
-
-        class BITMAPINFOHEADER(ctypes.Structure):
-            _fields_ = [
-                ("biSize", ctypes.c_uint32),
-                ("biWidth", ctypes.c_int32),
-                ("biHeight", ctypes.c_int32),
-                ("biPlanes", ctypes.c_uint16),
-                ("biBitCount", ctypes.c_uint16),
-                ("biCompression", ctypes.c_uint32),
-                ("biSizeImage", ctypes.c_uint32),
-                ("biXPelsPerMeter", ctypes.c_int32),
-                ("biYPelsPerMeter", ctypes.c_int32),
-                ("biClrUsed", ctypes.c_uint32),
-                ("biClrImportant", ctypes.c_uint32),
-            ]
-
-        bih = BITMAPINFOHEADER()
-        bih.biSize = ctypes.sizeof(BITMAPINFOHEADER)
-        bih.biWidth = w
-        bih.biHeight = -h  # negative = top-down
-        bih.biPlanes = 1
-        bih.biBitCount = 24
-        bih.biCompression = 0  # BI_RGB
-        bih.biSizeImage = len(pixels)
-
-        DIB_RGB_COLORS = 0
-        SRCCOPY = 0x00CC0020
-
-        gdi32.StretchDIBits(
-            hdc,
-            x1,
-            y1,
-            target_w,
-            target_h,  # dest rect
-            0,
-            0,
-            w,
-            h,  # src rect
-            pixels,
-            ctypes.byref(bih),
-            DIB_RGB_COLORS,
-            SRCCOPY,
+def _release_printer_dc(printer_name: str) -> None:
+    hdc = _DC_CACHE.pop(printer_name, None)
+    if hdc:
+        gdi32.DeleteDC(hdc)
+
+
+@atexit.register
+def _release_all_printer_dcs() -> None:
+    with _DC_LOCK:
+        for printer_name in list(_DC_CACHE):
+            _release_printer_dc(printer_name)
+
+
+@lru_cache(maxsize=8)
+def _printer_caps(printer_name: str) -> tuple[int, int, int]:
+    """Return (printable width, printable height, DPI) for a printer."""
+    with _DC_LOCK:
+        hdc = _get_printer_dc(printer_name)
+        return (
+            gdi32.GetDeviceCaps(hdc, HORZRES),
+            gdi32.GetDeviceCaps(hdc, VERTRES),
+            gdi32.GetDeviceCaps(hdc, LOGPIXELSX),
         )
 
-        gdi32.EndPage(hdc)
-        gdi32.EndDoc(hdc)
-    finally:
-        gdi32.DeleteDC(hdc)
+
+def _fit_to_page(width: int, height: int, printer_name: str) -> tuple[int, int]:
+    """Size that scales an image to the label width within the printable area."""
+    pw, ph, dpi = _printer_caps(printer_name)
+    max_w = int(CONFIG.width_inches * dpi)
+    target_w = min(max_w, pw)
+    target_h = target_w * height // width
+    if target_h > ph:
+        target_h = ph
+        target_w = target_h * width // height
+    return target_w, target_h
+
+
+def _image_to_dib(img: Image.Image) -> tuple[_BITMAPINFO, bytes]:
+    """Pack a PIL image as a top-down DIB: (BITMAPINFO, pixel rows)."""
+    if img.mode in ("1", "L"):
+        # Labels are grayscale; 8-bit palette indices are a third of 24-bit BGR
+        img = img.convert("L")
+        bit_count, mode, bytes_per_px = 8, "L", 1
+    else:
+        img = img.convert("RGB")
+        bit_count, mode, bytes_per_px = 24, "BGR", 3
+    w, h = img.size
+    # GDI expects rows padded to a multiple of 4 bytes
+    stride = (w * bytes_per_px + 3) & ~3
+    pixels = img.tobytes("raw", mode, stride)
+
+    bmi = _BITMAPINFO()
+    bih = bmi.bmiHeader
+    bih.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+    bih.biWidth = w
+    bih.biHeight = -h  # negative = top-down
+    bih.biPlanes = 1
+    bih.biBitCount = bit_count
+    bih.biCompression = 0  # BI_RGB
+    bih.biSizeImage = len(pixels)
+    if bit_count == 8:
+        bih.biClrUsed = 256
+        bmi.bmiColors[:] = _GRAY_PALETTE
+    return bmi, pixels
+
+
+def _print_dib_gdi(bmi: _BITMAPINFO, pixels: bytes, printer_name: str) -> None:
+    """Send a packed DIB to a Windows printer using raw GDI / ctypes."""
+    pw, ph, _ = _printer_caps(printer_name)
+    w, h = bmi.bmiHeader.biWidth, -bmi.bmiHeader.biHeight
+    # GDI scales the source-size DIB to the target rect; no resize here
+    target_w, target_h = _fit_to_page(w, h, printer_name)
+
+    # The DC is shared across prints, so jobs to it must not interleave
+    with _DC_LOCK:
+        hdc = _get_printer_dc(printer_name)
+        try:
+            # Start document
+            di = _DOCINFOW()
+            di.cbSize = ctypes.sizeof(_DOCINFOW)
+            di.lpszDocName = "Barcode Print"
+            # Duplicate/drop whole pixels when stretching so bars stay hard-edged
+            gdi32.SetStretchBltMode(hdc, COLORONCOLOR)
+            if gdi32.StartDocW(hdc, ctypes.byref(di)) <= 0:
+                raise RuntimeError("StartDoc failed")
+            gdi32.StartPage(hdc)
+
+            x1 = (pw - target_w) // 2
+            y1 = (ph - target_h) // 2
+
+            DIB_RGB_COLORS = 0
+            SRCCOPY = 0x00CC0020
+
+            gdi32.StretchDIBits(
+                hdc,
+                x1,
+                y1,
+                target_w,
+                target_h,  # dest rect
+                0,
+                0,
+                w,
+                h,  # src rect
+                pixels,
+                ctypes.byref(bmi),
+                DIB_RGB_COLORS,
+                SRCCOPY,
+            )
+
+            gdi32.EndPage(hdc)
+            gdi32.EndDoc(hdc)
+        except Exception:
+            # A failed job can leave the DC unusable; recreate it next time
+            _release_printer_dc(printer_name)
+            raise
 
 
 @dataclass
@@ -209,6 +398,16 @@ class PrintConfig:
     qr_box_size: int = 20
     qr_border: int = 4
     history_max_entries: int = 100
+    cache_max_size: int = 100
+    cache_max_bytes: int = 64 * 1024 * 1024
+    preview_debounce_seconds: float = 0.08
+    barcode_max_length: int = 80
+    barcode_module_px: int = 3
+    barcode_height_px: int = 180
+    barcode_quiet_zone_modules: int = 10
+    barcode_font_px: int = 40
+    history_flush_delay_seconds: float = 1.0
+    printer_list_ttl_seconds: float = 30.0
 
 
 CONFIG = PrintConfig()
@@ -216,98 +415,288 @@ CONFIG = PrintConfig()
 CODE_TYPE_BARCODE = "barcode"
 CODE_TYPE_QRCODE = "qrcode"
 QRCODE_SELECTOR_VALUE = "2"
+CODE128_INVALID_MESSAGE = (
+    f"Barcodes must be 1-{CONFIG.barcode_max_length} ASCII characters"
+)
+
+_PRINTERS_FETCHED_AT = 0.0
+
+
+@lru_cache(maxsize=1)
+def get_printers() -> list[str]:
+    global _PRINTERS_FETCHED_AT
+    _PRINTERS_FETCHED_AT = time.monotonic()
+    try:
+        return _enum_printers_simple()
+    except Exception:
+        return []
+
+
+def get_local_printers() -> list[str]:
+    """Local printers only; skips the slow per-user network connections."""
+    try:
+        return _enum_printers_simple(PRINTER_ENUM_LOCAL)
+    except Exception:
+        return []
+
+
+def printers_stale() -> bool:
+    """True when the cached printer list is older than the configured TTL."""
+    age = time.monotonic() - _PRINTERS_FETCHED_AT
+    return age > CONFIG.printer_list_ttl_seconds
+
+
+def refresh_printers() -> list[str]:
+    """Re-enumerate printers and drop per-printer state that may be stale."""
+    get_printers.cache_clear()
+    # A DC's devmode is fixed at creation, so paper size, orientation or DPI
+    # changes in the driver only show up on a fresh DC, even for known names
+    _release_all_printer_dcs()
+    _printer_caps.cache_clear()
+    return get_printers()
 
-_PRINTER_LIST_CACHE: Optional[list[str]] = None
-_CACHE_LOCK = threading.Lock()
 
+def _prefetch(fn) -> Future:
+    """Run ``fn`` on a daemon thread so a hung spooler call cannot block exit."""
+    future: Future = Future()
 
-def get_printers(force_refresh: bool = False) -> list[str]:
-    global _PRINTER_LIST_CACHE
-    if force_refresh or _PRINTER_LIST_CACHE is None:
+    def run():
         try:
-            _PRINTER_LIST_CACHE = _enum_printers_simple()
-        except Exception:
-            _PRINTER_LIST_CACHE = []
-    return _PRINTER_LIST_CACHE
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="printer-prefetch", daemon=True).start()
+    return future
+
+
+# Code128 module string ("1" = bar, "0" = space) to 8-bit grayscale pixels
+_MODULE_TO_PIXEL = bytes.maketrans(b"01", b"\xff\x00")
+# QR matrix cells (0 = light, 1 = dark) to 8-bit grayscale pixels
+_QR_CELL_TO_PIXEL = bytes.maketrans(b"\x00\x01", b"\xff\x00")
+
 
+# Only build() is used, which never touches the writer; sharing one instance
+# stops Code128 from constructing a default SVGWriter on every label
+_BARCODE_WRITER = python_barcode.writer.SVGWriter()
+
+
+@lru_cache(maxsize=1)
+def _label_font() -> ImageFont.FreeTypeFont:
+    return ImageFont.load_default(size=CONFIG.barcode_font_px)
+
+
+def _render_code128(barcode_text: str) -> Image.Image:
+    """Rasterize a Code128 label with C-level Pillow ops, not per-bar drawing."""
+    # python-barcode only encodes the symbol; the pixels are built here
+    symbol = python_barcode.codex.Code128(barcode_text, writer=_BARCODE_WRITER)
+    modules = symbol.build()[0]
+    quiet_zone = "0" * CONFIG.barcode_quiet_zone_modules
+    row = (quiet_zone + modules + quiet_zone).encode("ascii")
+    bars = Image.frombytes("L", (len(row), 1), row.translate(_MODULE_TO_PIXEL))
+    bars = bars.resize(
+        (len(row) * CONFIG.barcode_module_px, CONFIG.barcode_height_px),
+        Image.Resampling.NEAREST,
+    )
 
-@lru_cache(maxsize=100)
-def _generate_label_image_cached(
+    margin = CONFIG.barcode_font_px // 2
+    text_h = 3 * margin + CONFIG.barcode_font_px
+    label = Image.new("L", (bars.width, bars.height + text_h), 255)
+    label.paste(bars, (0, 0))
+    ImageDraw.Draw(label).text(
+        (label.width // 2, bars.height + margin),
+        barcode_text,
+        fill=0,
+        font=_label_font(),
+        anchor="mt",
+    )
+    return label
+
+
+def _render_qrcode(barcode_text: str) -> Image.Image:
+    """Rasterize a QR code from its module matrix instead of per-box drawing."""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        border=CONFIG.qr_border,
+    )
+    qr.add_data(barcode_text)
+    qr.make(fit=True)
+    # get_matrix() already includes the quiet-zone border
+    matrix = qr.get_matrix()
+    size = len(matrix)
+    cells = b"".join(bytes(row) for row in matrix).translate(_QR_CELL_TO_PIXEL)
+    modules = Image.frombytes("L", (size, size), cells)
+    px = size * CONFIG.qr_box_size
+    return modules.resize((px, px), Image.Resampling.NEAREST)
+
+
+def _render_label_image(
     barcode_text: str, code_type: str = CODE_TYPE_BARCODE
 ) -> Image.Image:
     if code_type == CODE_TYPE_QRCODE:
         try:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=CONFIG.qr_box_size,
-                border=CONFIG.qr_border,
-            )
-            qr.add_data(barcode_text)
-            qr.make(fit=True)
-            code_img = qr.make_image(fill_color="black", back_color="white")
-            if not isinstance(code_img, Image.Image):
-                code_img = code_img.convert("RGB")
-            return code_img
+            return _render_qrcode(barcode_text)
         except Exception as e:
             raise ValueError(f"Failed to generate QR code: {str(e)}")
     else:
         try:
-            code128 = python_barcode.get("code128", barcode_text, writer=ImageWriter())
-            with BytesIO() as buffer:
-                code128.write(buffer)
-                buffer.seek(0)
-                return Image.open(buffer).copy()
+            return _render_code128(barcode_text)
         except Exception as e:
             raise ValueError(f"Failed to generate barcode: {str(e)}")
 
 
+# Rendered labels, least recently used first. Entry count alone does not
+# bound memory (a long QR code is several MB), so resident bytes are tracked
+_LABEL_CACHE: OrderedDict = OrderedDict()  # key -> (value, nbytes)
+_LABEL_CACHE_BYTES = 0
+_LABEL_CACHE_LOCK = threading.Lock()
+_LAST_LABEL: Optional[tuple[str, str, Image.Image]] = None
+
+
+def _label_cache_get(key: tuple):
+    with _LABEL_CACHE_LOCK:
+        entry = _LABEL_CACHE.get(key)
+        if entry is None:
+            return None
+        _LABEL_CACHE.move_to_end(key)
+        return entry[0]
+
+
+def _label_cache_put(key: tuple, value, nbytes: int) -> None:
+    """Insert an entry, evicting LRU entries until within the byte budget."""
+    global _LABEL_CACHE_BYTES
+    with _LABEL_CACHE_LOCK:
+        old = _LABEL_CACHE.pop(key, None)
+        if old is not None:
+            _LABEL_CACHE_BYTES -= old[1]
+        _LABEL_CACHE[key] = (value, nbytes)
+        _LABEL_CACHE_BYTES += nbytes
+        while _LABEL_CACHE and (
+            _LABEL_CACHE_BYTES > CONFIG.cache_max_bytes
+            or len(_LABEL_CACHE) > CONFIG.cache_max_size
+        ):
+            _, (_, freed) = _LABEL_CACHE.popitem(last=False)
+            _LABEL_CACHE_BYTES -= freed
+
+
+def _is_valid_code128(text: str) -> bool:
+    """Cheap pre-check so rejected input never reaches python-barcode."""
+    return 0 < len(text) <= CONFIG.barcode_max_length and text.isascii()
+
+
 def generate_label_image(
     barcode_text: str, code_type: str = CODE_TYPE_BARCODE
 ) -> Image.Image:
+    global _LAST_LABEL
+    # Preview and print usually ask for the same label back to back
+    last = _LAST_LABEL
+    if last is not None and last[0] == barcode_text and last[1] == code_type:
+        return last[2]
     if not barcode_text or not barcode_text.strip():
         raise ValueError("Barcode text cannot be empty")
-    with _CACHE_LOCK:
-        return _generate_label_image_cached(barcode_text, code_type)
-
-
-def print_image(img: Image.Image, printer_name: str) -> None:
+    if code_type == CODE_TYPE_BARCODE and not _is_valid_code128(barcode_text):
+        raise ValueError(CODE128_INVALID_MESSAGE)
+    key = ("image", barcode_text, code_type)
+    img = _label_cache_get(key)
+    if img is None:
+        img = _render_label_image(barcode_text, code_type)
+        nbytes = img.width * img.height * len(img.getbands())
+        _label_cache_put(key, img, nbytes)
+    # Rebinding a tuple is atomic, so readers never see a half-updated slot
+    _LAST_LABEL = (barcode_text, code_type, img)
+    return img
+
+
+# One long-lived worker: print jobs run in order without a thread per click
+_PRINT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="print")
+
+
+def _label_dib(barcode_text: str, code_type: str) -> tuple[_BITMAPINFO, bytes]:
+    # Shares the label cache's byte budget; a packed DIB is as big as the image
+    key = ("dib", barcode_text, code_type)
+    dib = _label_cache_get(key)
+    if dib is None:
+        dib = _image_to_dib(generate_label_image(barcode_text, code_type))
+        _label_cache_put(key, dib, ctypes.sizeof(dib[0]) + len(dib[1]))
+    return dib
+
+
+def print_label(barcode_text: str, code_type: str, printer_name: str) -> None:
+    """Print a label, reusing its packed DIB on repeat prints."""
     if not printer_name:
         raise ValueError("Printer name cannot be empty")
-    available_printers = get_printers()
-    if printer_name not in available_printers:
-        raise ValueError(f"Printer '{printer_name}' not found")
+    bmi, pixels = _label_dib(barcode_text, code_type)
     try:
-        _print_image_gdi(img, printer_name)
+        _print_dib_gdi(bmi, pixels, printer_name)
     except Exception as exc:
+        # Only ask the spooler after a failure, so good prints skip the call
+        if not _printer_exists(printer_name):
+            raise ValueError(f"Printer '{printer_name}' not found")
         raise Exception(f"Print operation failed: {str(exc)}")
 
 
 APPDATA_DIR = Path(os.getenv("APPDATA")) / "BarcodePrinter"
 SETTINGS_FILE = APPDATA_DIR / "settings.json"
-HISTORY_FILE = APPDATA_DIR / "history.json"
+PRINTERS_FILE = APPDATA_DIR / "printers.json"
+
+_APPDATA_READY = False
+
+ICON_PATH = str(Path(__file__).resolve().parent / "assets" / "icon.ico")
+HISTORY_FILE = APPDATA_DIR / "history.jsonl"
+LEGACY_HISTORY_FILE = APPDATA_DIR / "history.json"
+
+HISTORY_TIME_FORMAT = "%m/%d/%Y %I:%M %p"
+
+_HISTORY: Optional[deque] = None  # newest first, capped by maxlen
+_HISTORY_FILE_LINES = 0
+_HISTORY_VERSION = 0  # bumped on every change so the UI can cache its table
+_HISTORY_PENDING: list[dict] = []  # saved in memory, not yet on disk
+_HISTORY_FLUSH_TIMER: Optional[threading.Timer] = None
+_HISTORY_LOCK = threading.Lock()
 
 
 def ensure_appdata_dir() -> None:
+    global _APPDATA_READY
+    if _APPDATA_READY:
+        return
     APPDATA_DIR.mkdir(parents=True, exist_ok=True)
+    _APPDATA_READY = True
+
+
+def _json_dumps(data, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def load_json_file(filepath: Path, default=None):
     if not filepath.exists():
         return default
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _json_loads(filepath.read_bytes())
+    except (ValueError, IOError):  # JSONDecodeError or invalid UTF-8
         return default
 
 
-def save_json_file(filepath: Path, data) -> None:
+def _atomic_write_bytes(filepath: Path, data: bytes) -> None:
     ensure_appdata_dir()
-    temp_fd, temp_path = tempfile.mkstemp(dir=APPDATA_DIR, suffix=".json", text=True)
+    temp_fd, temp_path = tempfile.mkstemp(dir=APPDATA_DIR, suffix=filepath.suffix)
     try:
-        with os.fdopen(temp_fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        with os.fdopen(temp_fd, "wb") as f:
+            f.write(data)
+            # Data must hit the disk before the rename, or a crash can leave
+            # the target file empty
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(temp_path, filepath)
     except Exception:
         try:
@@ -317,6 +706,11 @@ def save_json_file(filepath: Path, data) -> None:
         raise
 
 
+def save_json_file(filepath: Path, data) -> None:
+    # Settings stay indented for hand editing; history lines are compact
+    _atomic_write_bytes(filepath, _json_dumps(data, indent=True))
+
+
 def save_settings(printer: str, theme_mode) -> None:
     settings = {"printer": printer, "theme_mode": theme_mode.value}
     save_json_file(SETTINGS_FILE, settings)
@@ -326,35 +720,155 @@ def load_settings() -> Optional[dict]:
     return load_json_file(SETTINGS_FILE)
 
 
+def load_cached_printers() -> Optional[list[str]]:
+    return load_json_file(PRINTERS_FILE)
+
+
+def save_cached_printers(printers: list[str]) -> None:
+    try:
+        save_json_file(PRINTERS_FILE, printers)
+    except OSError:
+        pass  # the cache only speeds up the next launch
+
+
+def _new_history(entries=()) -> deque:
+    return deque(entries, maxlen=CONFIG.history_max_entries)
+
+
+def _read_history_file() -> tuple[deque, bool]:
+    """Parse the JSON-Lines history file: (entries newest first, damaged)."""
+    global _HISTORY_FILE_LINES
+    entries = _new_history()
+    lines = 0
+    damaged = False
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            for line in f:
+                # A crash mid-append can leave a partial last line with no
+                # newline; the next append would be glued onto it
+                if not line.endswith(b"\n"):
+                    damaged = True
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(_json_loads(line))
+                except ValueError:
+                    damaged = True  # torn write from a crash; drop the line
+                    continue
+                lines += 1
+    except IOError:
+        return _new_history(), False
+    _HISTORY_FILE_LINES = lines
+    entries.reverse()
+    return entries, damaged
+
+
+def _rewrite_history_file(history: deque) -> None:
+    """Atomically replace the history file with ``history`` (newest first)."""
+    global _HISTORY_FILE_LINES
+    lines = b"".join(_json_dumps(entry) + b"\n" for entry in reversed(history))
+    _atomic_write_bytes(HISTORY_FILE, lines)
+    _HISTORY_FILE_LINES = len(history)
+
+
+def _history_entries() -> deque:
+    """Return the in-memory history; caller must hold _HISTORY_LOCK."""
+    global _HISTORY
+    if _HISTORY is None:
+        if HISTORY_FILE.exists():
+            _HISTORY, damaged = _read_history_file()
+            if damaged:
+                _rewrite_history_file(_HISTORY)
+        else:
+            # One-time migration from the pre-JSONL history.json array
+            legacy = load_json_file(LEGACY_HISTORY_FILE, default=[])
+            _HISTORY = _new_history(legacy[: CONFIG.history_max_entries])
+            if _HISTORY:
+                _rewrite_history_file(_HISTORY)
+    return _HISTORY
+
+
+def _flush_history() -> None:
+    """Write queued history entries to disk in one append (or compaction)."""
+    global _HISTORY_FILE_LINES, _HISTORY_FLUSH_TIMER
+    with _HISTORY_LOCK:
+        _HISTORY_FLUSH_TIMER = None
+        if not _HISTORY_PENDING:
+            return
+        pending = len(_HISTORY_PENDING)
+        if _HISTORY_FILE_LINES + pending > 2 * CONFIG.history_max_entries:
+            _rewrite_history_file(_history_entries())
+        else:
+            ensure_appdata_dir()
+            with open(HISTORY_FILE, "ab") as f:
+                f.write(b"".join(_json_dumps(e) + b"\n" for e in _HISTORY_PENDING))
+            _HISTORY_FILE_LINES += pending
+        _HISTORY_PENDING.clear()
+
+
 def save_history_entry(
     barcode_text: str, printer_name: str, code_type: str = CODE_TYPE_BARCODE
 ) -> None:
-    history = load_history()
+    global _HISTORY_VERSION, _HISTORY_FLUSH_TIMER
+    now = datetime.now()
     entry = {
         "barcode": barcode_text,
         "printer": printer_name,
         "code_type": code_type,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
+        "formatted_time": now.strftime(HISTORY_TIME_FORMAT),
     }
-    history.insert(0, entry)
-    history = history[: CONFIG.history_max_entries]
-    save_json_file(HISTORY_FILE, history)
+    with _HISTORY_LOCK:
+        # The deque's maxlen drops the oldest entry in O(1)
+        _history_entries().appendleft(entry)
+        _HISTORY_VERSION += 1
+        # Batch bursts of prints into a single write shortly afterwards
+        _HISTORY_PENDING.append(entry)
+        if _HISTORY_FLUSH_TIMER is None:
+            _HISTORY_FLUSH_TIMER = threading.Timer(
+                CONFIG.history_flush_delay_seconds, _flush_history
+            )
+            _HISTORY_FLUSH_TIMER.daemon = True
+            _HISTORY_FLUSH_TIMER.start()
+
+
+@lru_cache(maxsize=256)
+def format_history_timestamp(timestamp: str) -> str:
+    return datetime.fromisoformat(timestamp).strftime(HISTORY_TIME_FORMAT)
 
 
 def load_history() -> list[dict]:
-    return load_json_file(HISTORY_FILE, default=[])
+    with _HISTORY_LOCK:
+        return list(_history_entries())
 
 
 def clear_history() -> None:
-    save_json_file(HISTORY_FILE, [])
+    global _HISTORY, _HISTORY_VERSION
+    with _HISTORY_LOCK:
+        _HISTORY = _new_history()
+        _HISTORY_VERSION += 1
+        _HISTORY_PENDING.clear()
+        _rewrite_history_file(_HISTORY)
+
 
+atexit.register(_flush_history)
 
-def pil_to_base64(img: Image.Image) -> str:
+
+def pil_to_png_bytes(img: Image.Image) -> bytes:
+    # Labels are two-colour; a 1-bit PNG encodes far faster and smaller
+    if img.mode != "1":
+        img = img.convert("1", dither=Image.Dither.NONE)
     buffer = BytesIO()
-    img.save(buffer, format="PNG")
-    buffer.seek(0)
-    img_base64 = base64.b64encode(buffer.read()).decode()
-    return f"data:image/png;base64,{img_base64}"
+    # Bars and modules are long runs that deflate well even at the fastest level
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=CONFIG.cache_max_size)
+def _generate_label_png_cached(
+    barcode_text: str, code_type: str = CODE_TYPE_BARCODE
+) -> bytes:
+    return pil_to_png_bytes(generate_label_image(barcode_text, code_type))
 
 
 def get_code_type_display(code_type: str) -> str:
@@ -368,12 +882,20 @@ def setup_page_config(page: ft.Page, saved_config: Optional[dict]) -> None:
     page.window.min_height = 700
     page.window.width = 700
     page.window.height = 700
-    page.window.icon = os.path.abspath("src/assets/icon.ico")
+    page.window.icon = ICON_PATH
     page.title = "Barcode Printer"
     saved_theme = saved_config.get("theme_mode") if saved_config else "dark"
     page.theme_mode = ft.ThemeMode.DARK if saved_theme == "dark" else ft.ThemeMode.LIGHT
 
 
+def pick_default_printer(
+    printers: list[str], saved_config: Optional[dict]
+) -> Optional[str]:
+    if saved_config and saved_config.get("printer") in printers:
+        return saved_config["printer"]
+    return printers[0] if printers else None
+
+
 def create_ui_components(
     page: ft.Page, printers: list[str], saved_config: Optional[dict]
 ) -> dict:
@@ -400,14 +922,10 @@ def create_ui_components(
         border_color=ft.Colors.PRIMARY,
     )
 
-    default_printer = printers[0] if printers else None
-    if saved_config and saved_config.get("printer") in printers:
-        default_printer = saved_config["printer"]
-
     printer_dropdown = ft.Dropdown(
         label="Select Printer",
         width=500,
-        value=default_printer,
+        value=pick_default_printer(printers, saved_config),
         options=[ft.dropdown.Option(p) for p in printers],
         border_color=ft.Colors.PRIMARY,
         disabled=len(printers) == 0,
@@ -433,10 +951,10 @@ def main(page: ft.Page) -> None:
     setup_page_config(page, saved_config)
 
     current_view = [0]
+    history_table_cache = [None, None]  # [history version, built control]
+    preview_request = [0]
 
-    printers = get_printers()
-    if not printers:
-
+    def show_no_printers_dialog():
         def close_dialog(e):
             page.window.destroy()
 
@@ -449,12 +967,25 @@ def main(page: ft.Page) -> None:
         )
         page.show_dialog(error_dialog)
 
+    # Show last run's printer list immediately; the prefetch replaces it later
+    saved_printers = [load_cached_printers()]  # what printers.json holds
+    printers = list(saved_printers[0] or [])
+
     components = create_ui_components(page, printers, saved_config)
     barcode_chooser = components["barcode_chooser"]
     barcode_text = components["barcode_text"]
     printer_dropdown = components["printer_dropdown"]
+    if not printers:
+        printer_dropdown.label = "Loading printers..."
     progress_bar = components["progress_bar"]
 
+    saved_printer = saved_config.get("printer") if saved_config else None
+    # True while the dropdown shows a fallback, not the saved or chosen printer
+    printer_auto_picked = [printer_dropdown.value != saved_printer]
+
+    def on_printer_select(e):
+        printer_auto_picked[0] = False
+
     async def on_window_event(e):
         if e.data == "focus":
             await barcode_text.focus()
@@ -462,6 +993,52 @@ def main(page: ft.Page) -> None:
 
     page.on_window_event = on_window_event
 
+    def on_printer_dropdown_focus(e):
+        # Pick up hot-plugged or renamed printers without restarting the app
+        if printers_stale():
+            page.run_task(refresh_printer_list)
+
+    refreshing_printers = [False]
+
+    def apply_printer_list(fresh: list[str]) -> bool:
+        if fresh == printers:
+            return False
+        printers[:] = fresh
+        printer_dropdown.options = [ft.dropdown.Option(p) for p in fresh]
+        printer_dropdown.disabled = len(fresh) == 0
+        # A fallback from a partial list yields once the saved printer appears
+        if printer_auto_picked[0] or printer_dropdown.value not in fresh:
+            printer_dropdown.value = pick_default_printer(fresh, saved_config)
+            printer_auto_picked[0] = printer_dropdown.value != saved_printer
+        return True
+
+    async def refresh_printer_list(startup: bool = False):
+        if refreshing_printers[0]:
+            return
+        refreshing_printers[0] = True
+        try:
+            if startup:
+                if _LOCAL_PRINTERS_PREFETCH is not None and not printers:
+                    # Nothing cached: show local printers before network ones
+                    local = await asyncio.wrap_future(_LOCAL_PRINTERS_PREFETCH)
+                    if apply_printer_list(local):
+                        page.update()
+                # Enumeration began at import; only wait for it to finish
+                fresh = await asyncio.wrap_future(_PRINTERS_PREFETCH)
+            else:
+                fresh = await asyncio.to_thread(refresh_printers)
+        finally:
+            refreshing_printers[0] = False
+        if not apply_printer_list(fresh) and not startup:
+            return
+        if fresh != saved_printers[0]:
+            await asyncio.to_thread(save_cached_printers, fresh)
+            saved_printers[0] = list(fresh)
+        printer_dropdown.label = "Select Printer"
+        if not fresh:
+            show_no_printers_dialog()
+        page.update()
+
     def get_selected_code_type() -> str:
         return (
             CODE_TYPE_QRCODE
@@ -489,16 +1066,31 @@ def main(page: ft.Page) -> None:
     async def show_preview(e):
         if not barcode_text.value or not barcode_text.value.strip():
             return
+        # Coalesce bursts of triggers; only the last one renders a preview
+        preview_request[0] += 1
+        request_id = preview_request[0]
+        await asyncio.sleep(CONFIG.preview_debounce_seconds)
+        if request_id != preview_request[0]:
+            return
         code_type = get_selected_code_type()
         try:
-            pil_img = generate_label_image(barcode_text.value.strip(), code_type)
-            b64_string = pil_to_base64(pil_img)
+            text = barcode_text.value.strip()
+
+            def render_preview():
+                pil_img = generate_label_image(text, code_type)
+                return pil_img, _generate_label_png_cached(text, code_type)
+
+            # Render off the event loop; drop the result if a newer request won
+            pil_img, png_bytes = await asyncio.to_thread(render_preview)
+            if request_id != preview_request[0]:
+                return
             display_h = 200
             img_w, img_h = pil_img.size
             display_w = int(img_w * (display_h / img_h))
 
+            # Raw bytes go to the client as binary, no base64 data URI needed
             dialog_image = ft.Image(
-                src=b64_string, width=display_w, height=display_h, border_radius=4
+                src=png_bytes, width=display_w, height=display_h, border_radius=4
             )
 
             def close_preview(e):
@@ -535,64 +1127,53 @@ def main(page: ft.Page) -> None:
         code_type = get_selected_code_type()
         text_to_print = barcode_text.value.strip()
         printer_name = printer_dropdown.value
+        if code_type == CODE_TYPE_BARCODE and not _is_valid_code128(text_to_print):
+            page.show_dialog(
+                ft.SnackBar(ft.Text(CODE128_INVALID_MESSAGE), bgcolor=ft.Colors.ERROR)
+            )
+            page.update()
+            return
 
         progress_bar.visible = True
         progress_bar.value = None
         page.update()
 
         def print_in_thread():
-            try:
-                img = generate_label_image(text_to_print, code_type)
-                print_image(img, printer_name)
-                save_history_entry(text_to_print, printer_name, code_type)
-
-                def show_success():
-                    page.show_dialog(ft.SnackBar(ft.Text("Print complete!")))
-                    page.update()
-
-                def hide_progress_success():
-                    progress_bar.visible = False
-                    page.update()
-
-                page.run_thread(show_success)
-                threading.Timer(
-                    0.5, lambda: page.run_thread(hide_progress_success)
-                ).start()
-
-            except Exception:
-
-                def show_error():
-                    progress_bar.color = ft.Colors.ERROR
-                    page.update()
-                    page.show_dialog(
-                        ft.SnackBar(
-                            ft.Text("Print failed!"),
-                            bgcolor=ft.Colors.ERROR,
-                        )
-                    )
-                    page.update()
-
-                def hide_progress_error():
-                    progress_bar.visible = False
-                    progress_bar.color = ft.Colors.PRIMARY
-                    page.update()
-
-                page.run_thread(show_error)
-                threading.Timer(
-                    0.5, lambda: page.run_thread(hide_progress_error)
-                ).start()
-
-        threading.Thread(target=print_in_thread, daemon=True).start()
+            print_label(text_to_print, code_type, printer_name)
+            save_history_entry(text_to_print, printer_name, code_type)
+
+        # Clear the field first so the next scan can start while the job spools
         barcode_text.value = ""
         await barcode_text.focus()
         page.update()
 
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                _PRINT_EXECUTOR, print_in_thread
+            )
+            page.show_dialog(ft.SnackBar(ft.Text("Print complete!")))
+        except Exception:
+            progress_bar.color = ft.Colors.ERROR
+            page.show_dialog(
+                ft.SnackBar(
+                    ft.Text("Print failed!"),
+                    bgcolor=ft.Colors.ERROR,
+                )
+            )
+        page.update()
+
+        await asyncio.sleep(0.5)
+        progress_bar.visible = False
+        progress_bar.color = ft.Colors.PRIMARY
+        page.update()
+
     async def focus_on_background_click(e):
         await barcode_text.focus()
 
     async def reprint_from_history(barcode: str, code_type: str):
         try:
-            set_clipboard_text(barcode)
+            # May retry while another app holds the clipboard; keep it off the loop
+            await asyncio.to_thread(set_clipboard_text, barcode)
         except Exception:
             pass  # clipboard failure is non-fatal
 
@@ -611,6 +1192,13 @@ def main(page: ft.Page) -> None:
         page.update()
 
     def build_history_table():
+        # Rebuild the rows only when the history has changed since last time
+        version = _HISTORY_VERSION
+        if history_table_cache[0] != version:
+            history_table_cache[:] = [version, render_history_table()]
+        return history_table_cache[1]
+
+    def render_history_table():
         history = load_history()
         if not history:
             return ft.Container(
@@ -626,8 +1214,10 @@ def main(page: ft.Page) -> None:
 
         rows = []
         for entry in history:
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            formatted_time = timestamp.strftime("%m/%d/%Y %I:%M %p")
+            # Entries written before formatted_time existed fall back to parsing
+            formatted_time = entry.get("formatted_time") or format_history_timestamp(
+                entry["timestamp"]
+            )
             code_type = entry.get("code_type", CODE_TYPE_BARCODE)
             type_text = get_code_type_display(code_type)
             entry_barcode = entry["barcode"]
@@ -783,6 +1373,18 @@ def main(page: ft.Page) -> None:
     page.add(progress_bar)
     page.add(print_view)
 
+    printer_dropdown.on_focus = on_printer_dropdown_focus
+    printer_dropdown.on_select = on_printer_select
+    page.run_task(refresh_printer_list, True)
+
+
+# Start the first enumeration while Flet boots; network printers can take
+# seconds. Without a cached list, a quick local-only pass fills the first paint
+_LOCAL_PRINTERS_PREFETCH: Optional[Future] = (
+    None if PRINTERS_FILE.exists() else _prefetch(get_local_printers)
+)
+_PRINTERS_PREFETCH = _prefetch(get_printers)
+
 
 if __name__ == "__main__":
     ft.run(main)